@@ -1,5 +1,5 @@
 from broker.config import BrokerConfig
-from broker.core import BrokerClient
+from broker.core import BrokerClient, RequeueMessage
 
 # TODO: Import only rabbit if tacoq[amqp] is installed
 from broker.rabbitmq import RabbitMQBroker
@@ -1,8 +1,28 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BrokerConfig:
-    """Configuration for a broker."""
+    """Configuration for a broker.
+
+    ### Attributes
+    - `url`: The URL of the broker.
+    - `pool_size`: Number of channels opened over the broker connection.
+      The worker only consumes on one, so raise it only when the client
+      borrows channels for other work. Must be at least 1.
+    - `pool_acquire_timeout`: Maximum time, in seconds, to wait for a free
+      channel before giving up.
+    - `prefetch_count`: Maximum number of unacknowledged messages the broker
+      delivers to each channel. Keep it close to the worker's
+      `max_concurrency` so the task pool stays full without starving other
+      workers on the same queue.
+    """
 
     url: str
+    pool_size: int = 1
+    pool_acquire_timeout: float = 10.0
+    prefetch_count: int = 64
+
+    def __post_init__(self):
+        if self.pool_size < 1:
+            raise ValueError("pool_size must be at least 1.")
@@ -1,5 +1,23 @@
+import asyncio
+import warnings
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Tuple
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Optional,
+    Tuple,
+)
+
+MessageCallback = Callable[[memoryview, str, str], Awaitable[None]]
+""" Called with the undecoded task input, task ID and task kind of a message."""
+
+
+class RequeueMessage(Exception):
+    """Raised by a `subscribe` callback to return its message to the queue
+    instead of dropping it."""
 
 
 class BrokerClient(ABC):
@@ -14,6 +32,91 @@ class BrokerClient(ABC):
         pass
 
     @abstractmethod
-    async def listen(self) -> AsyncGenerator[Tuple[str, str, str], None]:
-        """Listen to the worker queue."""
+    def acquire_channel(self) -> AsyncContextManager[Any]:
+        """Borrow a channel from the pool, returning it once the context exits.
+
+        ### Raises
+        - `TimeoutError`: If no channel becomes free in time
+        """
         pass
+
+    @abstractmethod
+    async def subscribe(self, callback: MessageCallback) -> None:
+        """Consume the worker queue, calling `callback` for every message
+        until cancelled. A message is acknowledged once its callback returns
+        and requeued if it raises `RequeueMessage`. Any other exception,
+        including cancellation, drops the message.
+
+        ### Parameters
+        - `callback`: Coroutine function called with the undecoded task input,
+          task ID and task kind of each message
+        """
+        pass
+
+    async def listen(self) -> AsyncGenerator[Tuple[memoryview, str, str], None]:
+        """Listen to the worker queue.
+
+        Deprecated: use `subscribe` instead. A message is acknowledged when
+        the caller asks for the next one or closes the generator. Messages
+        that were received but not yet handed out are requeued on close.
+
+        ### Yields
+        - `Tuple[memoryview, str, str]`: Undecoded task input, task ID and task kind
+        """
+        warnings.warn(
+            "BrokerClient.listen is deprecated, use subscribe instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        # Each callback blocks on its own future until the caller is done with
+        # the message, so only messages within the prefetch window are queued
+        messages: asyncio.Queue[
+            Tuple[Tuple[memoryview, str, str], asyncio.Future[None]]
+        ] = asyncio.Queue()
+        closed = asyncio.Event()
+
+        async def hand_over(payload: memoryview, task_id: str, task_kind: str):
+            if closed.is_set():
+                raise RequeueMessage()
+
+            handed_back = asyncio.get_running_loop().create_future()
+            messages.put_nowait(((payload, task_id, task_kind), handed_back))
+            await handed_back
+
+        consumer = asyncio.create_task(self.subscribe(hand_over))
+        getter: Optional[asyncio.Future] = None
+        handed_back: Optional[asyncio.Future[None]] = None
+        try:
+            while True:
+                getter = asyncio.ensure_future(messages.get())
+                await asyncio.wait(
+                    (getter, consumer), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not getter.done():
+                    # The consumer stopped, re-raise whatever stopped it
+                    consumer.result()
+                    return
+
+                (message, handed_back), getter = getter.result(), None
+                yield message
+                handed_back.set_result(None)
+                handed_back = None
+        finally:
+            if handed_back is not None:
+                handed_back.set_result(None)
+            if getter is not None:
+                # Stopped while waiting, possibly just after a message arrived
+                if getter.done() and not getter.cancelled():
+                    _, pending = getter.result()
+                    pending.set_exception(RequeueMessage())
+                getter.cancel()
+
+            # Release pending callbacks before waiting on the consumer, which
+            # may itself wait for them
+            closed.set()
+            while not messages.empty():
+                _, pending = messages.get_nowait()
+                pending.set_exception(RequeueMessage())
+            consumer.cancel()
+            await asyncio.wait((consumer,))
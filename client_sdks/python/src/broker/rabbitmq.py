@@ -1,8 +1,10 @@
-import json
-from typing import AsyncGenerator, Tuple
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from broker.config import BrokerConfig
-from broker.core import BrokerClient
+from broker.core import BrokerClient, MessageCallback, RequeueMessage
 from aio_pika import connect_robust
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
 
 
 class RabbitMQBroker(BrokerClient):
@@ -13,7 +15,7 @@ class RabbitMQBroker(BrokerClient):
         exchange_name (str): Name of the primary exchange
         worker_id (str): Unique identifier for this worker instance
         connection: Active connection to RabbitMQ server
-        channel: Active channel for communication
+        channels: Pool of open channels over the connection
         exchange: Declared exchange for message routing
     """
 
@@ -23,35 +25,74 @@ class RabbitMQBroker(BrokerClient):
         self.worker_id = worker_id  # Add worker_id to identify this worker
 
     async def connect(self) -> None:
-        """Establish connection to RabbitMQ server and setup channel.
+        """Establish connection to RabbitMQ server and open the channel pool.
+        Every channel is limited to `prefetch_count` unacknowledged messages.
 
         ### Raises
         - `ConnectionError`: If connection to RabbitMQ fails
         """
         self.connection = await connect_robust(self.config.url)
-        self.channel = await self.connection.channel()
+        self.channels: asyncio.Queue[AbstractChannel] = asyncio.Queue()
+
+        for _ in range(self.config.pool_size):
+            channel = await self.connection.channel()
+            await channel.set_qos(prefetch_count=self.config.prefetch_count)
+            self.channels.put_nowait(channel)
 
     async def disconnect(self) -> None:
         """Close RabbitMQ connection."""
         # Remove the exchanges
         await self.connection.close()
 
-    async def listen(self) -> AsyncGenerator[Tuple[str, str, str], None]:
-        """Listen for tasks of a specific type.
+    @asynccontextmanager
+    async def acquire_channel(self) -> AsyncIterator[AbstractChannel]:
+        """Borrow a channel from the pool, returning it once the context exits.
 
         ### Yields
-        - `str`: Decoded message body containing task data
+        - `AbstractChannel`: A channel not used by anyone else
+
+        ### Raises
+        - `TimeoutError`: If no channel is released within
+          `pool_acquire_timeout` seconds
+        """
+        async with asyncio.timeout(self.config.pool_acquire_timeout):
+            channel = await self.channels.get()
+
+        try:
+            yield channel
+        finally:
+            self.channels.put_nowait(channel)
+
+    async def subscribe(self, callback: MessageCallback) -> None:
+        """Consume the worker queue until cancelled. aio-pika runs `callback`
+        for each message directly from its delivery handler.
+
+        ### Parameters
+        - `callback`: Called with a view over the message body, which the
+          worker decodes with `task_input_from_buffer`, the task ID and the
+          task kind
 
         ### Raises
         - `ConnectionError`: If broker connection is lost
         """
-        # The queue should have been created sucessfully on the gateway side
-        # The queue name should be the id of the worker
-        queue_instance = await self.channel.declare_queue(self.worker_id, durable=False)
 
-        async for message in queue_instance.iterator():
-            async with message.process():
+        async def on_message(message: AbstractIncomingMessage) -> None:
+            async with message.process(ignore_processed=True):
                 task_kind = message.headers.get("task_kind")
-                yield json.loads(message.body.decode()), message.message_id, task_kind
+                try:
+                    await callback(
+                        memoryview(message.body), message.message_id, task_kind
+                    )
+                except RequeueMessage:
+                    await message.reject(requeue=True)
+
+        # The queue should have been created sucessfully on the gateway side
+        # The queue name should be the id of the worker
+        async with self.acquire_channel() as channel:
+            queue_instance = await channel.declare_queue(self.worker_id, durable=False)
+            consumer_tag = await queue_instance.consume(on_message)
 
-        await queue_instance.delete()
+            try:
+                await asyncio.Future()
+            finally:
+                await queue_instance.cancel(consumer_tag)
@@ -3,15 +3,8 @@ import asyncio
 from cli.runner import run_application
 from cli.importer import ImportFromStringError
 from cli.logger import logger
-from functools import wraps
-
-
-def async_cmd(f):
-    @wraps(f)
-    def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
-
-    return wrapper
+from cli.loops import LOOP_CHOICES, get_loop_factory
+from cli.supervisor import run_multiprocess
 
 
 @click.group()
@@ -28,9 +21,30 @@ def cli():
 @cli.command()
 @click.argument("app", type=str, required=True)
 @click.option("--reload", is_flag=True, help="Enable live reload for development.")
-@async_cmd
-async def run(app: str, reload: bool):
+@click.option(
+    "--loop",
+    type=click.Choice(LOOP_CHOICES),
+    default="auto",
+    show_default=True,
+    help="Event loop implementation.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes, each pinned to its own CPU on Linux.",
+)
+def run(app: str, reload: bool, loop: str, workers: int):
     """Run Worker Application"""
+    if reload and workers > 1:
+        raise click.UsageError("--reload cannot be used with multiple --workers.")
+
+    try:
+        loop_factory = get_loop_factory(loop)
+    except RuntimeError as exc:
+        raise click.UsageError(str(exc))
+
     logger.info(f"Starting TacoQ worker application: {app}")
 
     if reload:
@@ -38,8 +52,13 @@ async def run(app: str, reload: bool):
     else:
         logger.info("Starting worker in production mode...")
 
+    if workers > 1:
+        if not run_multiprocess(app, workers, loop):
+            raise click.Abort()
+        return
+
     try:
-        await run_application(app, reload=reload)
+        asyncio.run(run_application(app, reload=reload), loop_factory=loop_factory)
     except ImportFromStringError as exc:
         logger.error(f"Failed to import application: {exc}")
         raise click.Abort()
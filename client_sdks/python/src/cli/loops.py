@@ -0,0 +1,58 @@
+import asyncio
+import sys
+from typing import Callable, Optional
+
+LOOP_CHOICES = ("auto", "asyncio", "uvloop")
+""" Event loop implementations that can be selected from the CLI."""
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+
+def _uvloop_factory() -> Optional[LoopFactory]:
+    """Get the uvloop loop factory if uvloop is usable on this platform.
+
+    ### Returns
+        - `LoopFactory`: uvloop's loop factory, or `None` if unavailable
+    """
+    # uvloop does not support Windows
+    if sys.platform == "win32":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
+def get_loop_factory(loop: str) -> Optional[LoopFactory]:
+    """Resolve an event loop choice into a factory for `asyncio.run`.
+
+    `auto` picks the fastest available implementation, falling back
+    to the default asyncio loop.
+
+    ### Args:
+        - `loop`: One of `LOOP_CHOICES`
+
+    ### Returns:
+        - `LoopFactory`: Loop factory, or `None` for the default asyncio loop
+
+    ### Raises:
+        - `RuntimeError`: If the requested loop is not available
+        - `ValueError`: If the loop choice is unknown
+    """
+    match loop:
+        case "auto":
+            return _uvloop_factory()
+        case "asyncio":
+            return None
+        case "uvloop":
+            factory = _uvloop_factory()
+            if factory is None:
+                raise RuntimeError(
+                    "uvloop is not available. Install the package with its `uvloop` extra."
+                )
+            return factory
+        case _:
+            raise ValueError(f"Unknown event loop: {loop}")
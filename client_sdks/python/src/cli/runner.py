@@ -2,12 +2,14 @@ import asyncio
 import signal
 import traceback
 from typing import Optional
-from contextlib import AsyncExitStack
 from worker.client import WorkerApplication
 from cli.logger import logger
 from cli.reloader import ModuleReloader
 from cli.importer import import_from_string
 
+SHUTDOWN_TIMEOUT = 5.0
+""" Seconds a cancelled application gets to clean up before it is cancelled again."""
+
 
 class ApplicationRunner:
     """
@@ -25,13 +27,13 @@ class ApplicationRunner:
     ### Attributes:
         - `app`: WorkerApplication instance
         - `_import_string`: Import string for the WorkerApplication instance
-        - `_shutdown_event`: Event to signal shutdown
         - `_task`: Task for running the application
         - `_loop`: Event loop for the application
 
     ### Methods:
         - `_handle_signals`: Configure signal handlers for graceful shutdown
-        - `_signal_handler`: Handle shutdown signals
+        - `_signal_handler`: Handle shutdown signals by cancelling the application task
+        - `_cancel_with_deadline`: Cancel a task, forcing it to stop after a timeout
         - `startup`: Initialize and start the worker application
         - `_cleanup_app_task`: Helper method to cleanup running application
         - `_create_and_run_app_task`: Create and start the application task
@@ -51,21 +53,40 @@ class ApplicationRunner:
         """
         self.app = app
         self._import_string = import_string
-        self._shutdown_event = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
-        self._loop = asyncio.get_event_loop()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _handle_signals(self):
-        """Configure signal handlers for graceful shutdown"""
+        """Configure signal handlers for graceful shutdown. Must be called
+        once the application task exists."""
         for sig in (signal.SIGTERM, signal.SIGINT):
-            self._loop.add_signal_handler(
-                sig, lambda: asyncio.create_task(self._signal_handler())
-            )
+            self._loop.add_signal_handler(sig, self._signal_handler)
+
+    def _signal_handler(self):
+        """Handle shutdown signals. Runs directly as a loop callback, so it
+        must not block or await.
 
-    async def _signal_handler(self):
-        """Handle shutdown signals"""
+        Cancelling the application task is enough to shut down: the worker
+        unregisters itself when its entrypoint is cancelled.
+        """
         logger.warning("Shutdown signal received...")
-        self._shutdown_event.set()
+        self._cancel_with_deadline(self._task)
+
+    def _cancel_with_deadline(self, task: asyncio.Task) -> None:
+        """Cancel a task and cancel it again if it is still cleaning up after
+        `SHUTDOWN_TIMEOUT` seconds, which interrupts whatever it is awaiting.
+
+        ### Args:
+            - `task`: Task to cancel
+        """
+
+        def on_deadline():
+            logger.warning("Application shutdown timed out")
+            task.cancel()
+
+        task.cancel()
+        deadline = self._loop.call_later(SHUTDOWN_TIMEOUT, on_deadline)
+        task.add_done_callback(lambda _: deadline.cancel())
 
     async def startup(self, reload: bool = False):
         """
@@ -75,7 +96,7 @@ class ApplicationRunner:
             `reload`: Enable hot reload mode
         """
         logger.info("Initializing application...")
-        self._handle_signals()
+        self._loop = asyncio.get_running_loop()
 
         if reload:
             self._task = asyncio.create_task(self._run_with_reload())
@@ -83,17 +104,13 @@ class ApplicationRunner:
             self._task = asyncio.create_task(self.app.entrypoint())
             logger.info("Application started successfully")
 
-        try:
-            # Wait for either shutdown signal or task completion
-            done, pending = await asyncio.wait(
-                [asyncio.create_task(self._shutdown_event.wait()), self._task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            # If task completed first and has an exception, propagate it
-            if self._task in done and self._task.exception():
-                raise self._task.exception()
+        self._handle_signals()
 
+        try:
+            # Runs until the application finishes or a signal cancels it
+            await self._task
+        except asyncio.CancelledError:
+            logger.info("Application shutdown complete")
         except Exception:
             logger.error("Application crashed with traceback:")
             traceback.print_exc()
@@ -114,16 +131,14 @@ class ApplicationRunner:
                     await self.app.shutdown()
 
                 # Cancel the task and wait for it
-                app_task.cancel()
-                await asyncio.wait_for(app_task, timeout=5.0)
+                self._cancel_with_deadline(app_task)
+                await app_task
             except asyncio.CancelledError:
                 pass  # Suppress cleanup logs
-            except asyncio.TimeoutError:
-                logger.warning("Application cleanup timed out")
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
 
-    async def _create_and_run_app_task(self) -> asyncio.Task:
+    def _create_and_run_app_task(self) -> asyncio.Task:
         """Create and start the application task
 
         ### Returns:
@@ -131,7 +146,7 @@ class ApplicationRunner:
         """
         return asyncio.create_task(self.app.entrypoint())
 
-    async def _handle_task_result(self, task: asyncio.Task) -> None:
+    def _handle_task_result(self, task: asyncio.Task) -> None:
         """Handle task completion and propagate exceptions
 
         ### Args:
@@ -160,15 +175,12 @@ class ApplicationRunner:
         logger.info("Application started successfully")
 
         while True:
-            self._shutdown_event.clear()
-
             if app_task is None:
-                app_task = await self._create_and_run_app_task()
+                app_task = self._create_and_run_app_task()
 
             if reload_task is None:
-                reload_task = asyncio.shield(
-                    asyncio.create_task(reloader.watch_and_reload())
-                )
+                # Kept as a plain task so cancelling it also stops the watcher
+                reload_task = asyncio.create_task(reloader.watch_and_reload())
 
             try:
                 done = await self._wait_for_completion(reload_task, app_task)
@@ -176,7 +188,7 @@ class ApplicationRunner:
                 if app_task in done:
                     if reload_task and not reload_task.done():
                         reload_task.cancel()
-                    await self._handle_task_result(app_task)
+                    self._handle_task_result(app_task)
                     return
 
                 if reload_task in done and reload_task.result():
@@ -205,11 +217,9 @@ class ApplicationRunner:
         if self._task and not self._task.done():
             try:
                 logger.info("Initiating graceful shutdown...")
-                self._task.cancel()
-                await asyncio.wait_for(self._task, timeout=5.0)
+                self._cancel_with_deadline(self._task)
+                await self._task
                 logger.info("Shutdown completed successfully")
-            except asyncio.TimeoutError:
-                logger.warning("Application shutdown timed out")
             except asyncio.CancelledError:
                 logger.info("Application shutdown complete")
             except Exception as e:
@@ -229,10 +239,8 @@ async def run_application(
         `app_import_string`: Import string for the WorkerApplication instance
         `reload`: Enable hot reload mode for development
     """
-    async with AsyncExitStack():
-        app = import_from_string(app_import_string)
-        if not isinstance(app, WorkerApplication):
-            raise TypeError("Application must be an instance of WorkerApplication")
+    app = import_from_string(app_import_string)
+    if not isinstance(app, WorkerApplication):
+        raise TypeError("Application must be an instance of WorkerApplication")
 
-        runner = ApplicationRunner(app, app_import_string)
-        await runner.startup(reload)
+    await ApplicationRunner(app, app_import_string).startup(reload)
@@ -0,0 +1,139 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+import sys
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event
+from typing import Optional
+from cli.logger import logger
+from cli.loops import get_loop_factory
+from cli.runner import run_application
+
+SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+""" Signals that shut the worker processes down."""
+
+
+def _pin_to_cpu(index: int) -> None:
+    """Pin the current process to a single CPU, where the platform allows it.
+
+    ### Args:
+        - `index`: Index of the worker process, used to pick the CPU
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+
+    cpus = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def _exit_before_startup(signum, _frame) -> None:
+    """Exit a worker process that is shut down before its application has
+    started, so there is nothing to clean up yet."""
+    raise SystemExit(0)
+
+
+def _run_worker_process(
+    app_import_string: str, loop: str, index: int, ready: Event
+) -> None:
+    """Entrypoint of a worker process. Each process imports the application
+    again and runs it on its own event loop.
+
+    ### Args:
+        - `app_import_string`: Import string for the WorkerApplication instance
+        - `loop`: Event loop implementation, one of `LOOP_CHOICES`
+        - `index`: Index of the worker process
+        - `ready`: Set once the process can be sent shutdown signals
+    """
+    # The runner replaces these handlers once the application is starting
+    for sig in SHUTDOWN_SIGNALS:
+        signal.signal(sig, _exit_before_startup)
+
+    # Signals reach the workers through the supervisor only, so a Ctrl+C in
+    # the terminal is not delivered twice
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+    ready.set()
+
+    _pin_to_cpu(index)
+
+    try:
+        asyncio.run(
+            run_application(app_import_string), loop_factory=get_loop_factory(loop)
+        )
+    except Exception as e:
+        logger.error(f"Worker process {index} crashed: {e}")
+        sys.exit(1)
+
+
+def run_multiprocess(app_import_string: str, workers: int, loop: str) -> bool:
+    """Run several worker processes and wait for all of them to exit.
+
+    Shutdown signals received by the supervisor are forwarded to every
+    worker process, including those still starting up when it arrived.
+
+    ### Args:
+        - `app_import_string`: Import string for the WorkerApplication instance
+        - `workers`: Number of worker processes to start
+        - `loop`: Event loop implementation, one of `LOOP_CHOICES`
+
+    ### Returns:
+        - `bool`: True if every worker process exited cleanly
+    """
+    context = multiprocessing.get_context("spawn")
+    ready_events = [context.Event() for _ in range(workers)]
+    processes: list[BaseProcess] = [
+        context.Process(
+            target=_run_worker_process,
+            args=(app_import_string, loop, index, ready),
+            name=f"tacoq-worker-{index}",
+        )
+        for index, ready in enumerate(ready_events)
+    ]
+
+    # Processes that have installed their signal handlers. A signal sent to a
+    # process before then would kill it while it is still starting up
+    reachable: list[BaseProcess] = []
+    signalled: set[int] = set()
+    shutdown_signal: Optional[int] = None
+
+    def signal_process(process: BaseProcess, signum: int):
+        if process.is_alive():
+            signalled.add(process.pid)
+            os.kill(process.pid, signum)
+
+    def forward_signal(signum, _frame):
+        nonlocal shutdown_signal
+        shutdown_signal = signum
+        for process in reachable:
+            signal_process(process, signum)
+
+    previous_handlers = {
+        sig: signal.signal(sig, forward_signal) for sig in SHUTDOWN_SIGNALS
+    }
+
+    try:
+        for process in processes:
+            process.start()
+        logger.info(f"Started {workers} worker processes")
+
+        for process, ready in zip(processes, ready_events):
+            while not ready.wait(0.1) and process.is_alive():
+                pass
+            reachable.append(process)
+            # Skipped if the signal arrived after the append and was forwarded
+            if shutdown_signal is not None and process.pid not in signalled:
+                signal_process(process, shutdown_signal)
+
+        for process in processes:
+            process.join()
+    finally:
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+
+    failed = [process for process in processes if process.exitcode != 0]
+    for process in failed:
+        logger.error(f"{process.name} exited with code {process.exitcode}")
+
+    return not failed
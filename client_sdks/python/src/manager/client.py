@@ -1,9 +1,12 @@
+import asyncio
+import json
 from enum import Enum
 from typing import Optional
 from dataclasses import dataclass
 
 from uuid import UUID
 import aiohttp as aio
+import orjson
 
 from manager.config import ManagerConfig
 from models.task import (
@@ -20,6 +23,16 @@ TASK_PATH = "/tasks"
 """ Base path for task CRUD operations."""
 
 
+def _dumps_json(data: object) -> str:
+    """Serialize request bodies with orjson. Non-string keys are allowed to
+    match the standard library's behaviour. orjson rejects integers outside
+    the 64-bit range, so those bodies fall back to the standard library."""
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(data)
+
+
 class ManagerStates(str, Enum):
     """Possible states of the manager.
 
@@ -42,6 +55,12 @@ class ManagerClient:
 
     config: ManagerConfig
 
+    def _session(self) -> aio.ClientSession:
+        """Create an HTTP session that uses orjson for request bodies."""
+        return aio.ClientSession(
+            timeout=self.config.timeout, json_serialize=_dumps_json
+        )
+
     # Check whether the manager is healthy
 
     async def check_health(self) -> ManagerStates:
@@ -53,7 +72,7 @@ class ManagerClient:
         - `ManagerStates`: Whether the manager is healthy.
         """
         try:
-            async with aio.ClientSession(timeout=self.config.timeout) as session:
+            async with self._session() as session:
                 async with session.get(f"{self.config.url}/health") as resp:
                     match resp.status:
                         case 200:
@@ -76,10 +95,10 @@ class ManagerClient:
         ### Returns
         - `TaskInstance`: The task details
         """
-        async with aio.ClientSession(timeout=self.config.timeout) as session:
+        async with self._session() as session:
             async with session.get(f"{self.config.url}{TASK_PATH}/{task_id}") as resp:
                 resp.raise_for_status()
-                data = await resp.json()
+                data = await resp.json(loads=orjson.loads)
                 return TaskInstance.from_dict(data)
 
     async def publish_task(
@@ -94,13 +113,13 @@ class ManagerClient:
         ### Returns
         - `TaskInstance`: The created task details
         """
-        async with aio.ClientSession(timeout=self.config.timeout) as session:
+        async with self._session() as session:
             async with session.post(
                 f"{self.config.url}{TASK_PATH}",
                 json={"task_kind_name": task_kind_name, "input_data": input_data},
             ) as resp:
                 resp.raise_for_status()
-                data = await resp.json()
+                data = await resp.json(loads=orjson.loads)
                 return TaskInstance.from_dict(data)
 
     async def update_task_status(self, task_id: UUID, status: TaskStatus) -> None:
@@ -110,7 +129,7 @@ class ManagerClient:
         - `task_id`: UUID of the task to update
         - `status`: New status for the task
         """
-        async with aio.ClientSession(timeout=self.config.timeout) as session:
+        async with self._session() as session:
             async with session.put(
                 f"{self.config.url}{TASK_PATH}/{task_id}/status", json=status.value
             ) as resp:
@@ -126,13 +145,58 @@ class ManagerClient:
         - `data`: Result data or error message
         - `is_error`: Whether this is an error result
         """
-        async with aio.ClientSession(timeout=self.config.timeout) as session:
+        async with self._session() as session:
             async with session.put(
                 f"{self.config.url}{TASK_PATH}/{task_id}/result",
                 json={"data": data, "is_error": is_error},
             ) as resp:
                 resp.raise_for_status()
 
+    async def update_task_result_batch(
+        self, results: list[tuple[UUID, TaskOutput, bool]]
+    ) -> None:
+        """Submit results or errors for several tasks at once. All updates
+        share a single HTTP session and are sent concurrently. A result that
+        cannot be serialized is submitted as an error instead.
+
+        ### Parameters
+        - `results`: List of `(task_id, data, is_error)` tuples
+
+        ### Raises
+        - `aio.ClientError`: The first error encountered, after all updates
+          have been attempted
+        """
+
+        async def put_result(
+            session: aio.ClientSession, task_id: UUID, data: TaskOutput, is_error: bool
+        ) -> None:
+            try:
+                body = _dumps_json({"data": data, "is_error": is_error})
+            except (TypeError, ValueError) as e:
+                body = _dumps_json(
+                    {
+                        "data": f"Task result could not be serialized: {e}",
+                        "is_error": True,
+                    }
+                )
+
+            async with session.put(
+                f"{self.config.url}{TASK_PATH}/{task_id}/result",
+                data=body,
+                headers={"Content-Type": "application/json"},
+            ) as resp:
+                resp.raise_for_status()
+
+        async with self._session() as session:
+            outcomes = await asyncio.gather(
+                *(put_result(session, *result) for result in results),
+                return_exceptions=True,
+            )
+
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
     # Worker registration and unregistration
 
     async def register_worker(self, name: str, task_kinds: list[str]) -> UUID:
@@ -146,13 +210,13 @@ class ManagerClient:
         - `UUID`: The ID of the registered worker.
         """
 
-        async with aio.ClientSession(timeout=self.config.timeout) as session:
+        async with self._session() as session:
             async with session.post(
                 f"{self.config.url}{WORKER_PATH}",
                 json={"name": name, "task_kinds": task_kinds},
             ) as resp:
                 resp.raise_for_status()
-                data = await resp.json()
+                data = await resp.json(loads=orjson.loads)
                 return UUID(data["id"])
 
     async def unregister_worker(self, worker_id: UUID) -> None:
@@ -161,7 +225,7 @@ class ManagerClient:
         ### Parameters
         - `worker_id`: The ID of the worker to unregister.
         """
-        async with aio.ClientSession(timeout=self.config.timeout) as session:
+        async with self._session() as session:
             async with session.delete(
                 f"{self.config.url}{WORKER_PATH}/{worker_id}"
             ) as resp:
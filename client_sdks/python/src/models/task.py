@@ -4,11 +4,27 @@ from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
+import orjson
+
 
 TaskInput = dict[str, Any]  # Maps to Option<serde_json::Value>
 TaskOutput = dict[str, Any]  # Maps to Option<serde_json::Value>
 
 
+def task_input_from_buffer(buffer: memoryview) -> Optional[TaskInput]:
+    """Decodes a TaskInput from a raw JSON message body without copying it.
+    Integers outside the 64-bit range are decoded as floats.
+
+    ### Parameters
+    - `buffer`: View over the encoded task input, as delivered by the broker.
+
+    ### Returns
+    - `TaskInput`: The decoded task input.
+    """
+
+    return orjson.loads(buffer)
+
+
 class TaskStatus(str, Enum):
     """The status of a task.
 
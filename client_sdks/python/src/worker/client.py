@@ -1,46 +1,81 @@
 import asyncio
-from dataclasses import dataclass
-from typing import Callable, Awaitable, Optional, Dict
+import logging
+from functools import partial
+from typing import Callable, Awaitable, Optional, Dict, Set, Tuple
+from uuid import UUID
 
 from broker import create_broker_instance, BrokerClient
 from manager import ManagerClient
-from models.task import TaskInput, TaskOutput
+from models.task import TaskInput, TaskOutput, task_input_from_buffer
 
 from worker.config import WorkerApplicationConfig
 
+logger = logging.getLogger("tacoq")
+""" Shares its name with the CLI logger, which configures its output."""
+
 
-@dataclass
 class WorkerApplication:
     """A worker application that processes tasks from a task queue.
 
     ### Attributes
     - `_config`: Configuration for the worker application
-    - `_tasks`: Mapping of task kinds to their handler functions
+    - `_registered_tasks`: Mapping of task kinds to their handler functions
+    - `_task_kinds`: Registered task kinds, kept in sync with `_registered_tasks`
     - `_broker_client`: Client for communicating with the message broker
     - `_manager_client`: Client for communicating with the task manager
     - `_id`: Unique identifier assigned by the manager
+    - `_running_tasks`: Tasks currently being executed
+    - `_result_updates`: Queue of task results waiting to be submitted
+    - `_result_flusher`: Background task that submits task results in batches
 
     ### Methods
     - `register_task`: Register a task handler function for a specific task kind
     - `task`: Decorator for registering task handler functions
     - `_register_worker`: Register this worker with the manager and initialize broker connection
     - `_unregister_worker`: Unregister from the manager and clean up broker connection
-    - `_execute_task`: Execute a task and update its status in the manager
+    - `_execute_task`: Execute a task and queue its result for the manager
+    - `_submit_results`: Submit a batch of task results to the manager
     - `_listen`: Listen for tasks of a specific kind from the broker
+    - `_dispatch`: Execute a task delivered by the broker
+    - `_wait_for_running_tasks`: Wait for all in-flight tasks to finish
+    - `_run_result_flusher`: Submit queued task results in batches until cancelled
+    - `_flush_result_updates`: Submit all pending task results
     - `entrypoint`: Start the worker application
     """
 
+    __slots__ = (
+        "_config",
+        "_id",
+        "_registered_tasks",
+        "_task_kinds",
+        "_broker_client",
+        "_manager_client",
+        "_running_tasks",
+        "_result_updates",
+        "_result_flusher",
+    )
+
     _config: WorkerApplicationConfig
+    _id: Optional[UUID]
     _registered_tasks: Dict[str, Callable[[TaskInput], Awaitable[TaskOutput]]]
+    _task_kinds: Tuple[str, ...]
     _broker_client: Optional[BrokerClient]
     _manager_client: ManagerClient
+    _running_tasks: Set[asyncio.Task]
+    _result_updates: asyncio.Queue[Tuple[str, TaskOutput, bool]]
+    _result_flusher: Optional[asyncio.Task]
 
     def __init__(self, config: WorkerApplicationConfig):
         self._config = config
         self._id = None
 
+        self._broker_client = None
         self._manager_client = ManagerClient(config.manager_config)
         self._registered_tasks = {}
+        self._task_kinds = ()
+        self._running_tasks = set()
+        self._result_updates = asyncio.Queue()
+        self._result_flusher = None
 
     def register_task(
         self, kind: str, task: Callable[[TaskInput], Awaitable[TaskOutput]]
@@ -52,6 +87,7 @@ class WorkerApplication:
         - `task`: Async function that processes tasks of this kind
         """
         self._registered_tasks[kind] = task
+        self._task_kinds = tuple(self._registered_tasks)
 
     def task(self, kind: str) -> Callable[[TaskInput], Awaitable[TaskOutput]]:
         """Decorator for registering task handler functions.
@@ -73,10 +109,14 @@ class WorkerApplication:
         """Register this worker with the manager and initialize broker connection.
 
         ### Raises
+        - `ValueError`: If no tasks have been registered
         - `ConnectionError`: If connection to manager or broker fails
         """
+        if not self._task_kinds:
+            raise ValueError("No tasks registered.")
+
         worker = await self._manager_client.register_worker(
-            self._config.name, list(self._registered_tasks.keys())
+            self._config.name, list(self._task_kinds)
         )
         self._id = worker
 
@@ -95,6 +135,8 @@ class WorkerApplication:
         if self._id is None:
             raise ValueError("Worker is not registered.")
 
+        await self._flush_result_updates()
+
         try:
             if self._broker_client:
                 await self._broker_client.disconnect()
@@ -110,47 +152,140 @@ class WorkerApplication:
         # Important for hot reloading code
         self.cleanup()
 
-    async def _execute_task(self, kind: str, input_data: TaskInput, task_id: str):
-        """Execute a task and update its status in the manager.
+    async def _execute_task(
+        self,
+        task_func: Callable[[TaskInput], Awaitable[TaskOutput]],
+        payload: memoryview,
+        task_id: str,
+    ):
+        """Execute a task and queue its result for submission to the manager.
 
         ### Parameters
-        - `kind`: Type of task to execute
-        - `input_data`: Input data for the task
+        - `task_func`: Handler function registered for the task's kind
+        - `payload`: Undecoded input data for the task. It is decoded here, so
+          a malformed payload is reported as a task failure.
         - `task_id`: Unique identifier for the task
+        """
+        is_error = False
+        try:
+            result = await task_func(task_input_from_buffer(payload))
+        except Exception as e:
+            logger.exception(f"Task {task_id} failed")
+            result, is_error = str(e), True
 
-        ### Raises
-        - `ValueError`: If task kind is not registered
+        self._result_updates.put_nowait((task_id, result, is_error))
+
+    async def _submit_results(self, batch: list[Tuple[str, TaskOutput, bool]]):
+        """Submit a batch of task results to the manager. Failures are logged
+        rather than raised so that one bad batch does not stop the worker.
+
+        ### Parameters
+        - `batch`: List of `(task_id, data, is_error)` tuples taken from the queue
         """
-        task_func = self._registered_tasks.get(kind)
-        if task_func is None:
-            raise ValueError(f"Task {kind} not registered.")
+        if not batch:
+            return
 
         try:
-            # Check what to do with the task result
-            result = await task_func(input_data)
-            await self._manager_client.update_task_result(
-                task_id, result, is_error=False
-            )
+            await self._manager_client.update_task_result_batch(batch)
         except Exception as e:
-            # Log the exception (could improve error handling)
-            await self._manager_client.update_task_result(
-                task_id, str(e), is_error=True
-            )
+            logger.error(f"Failed to submit {len(batch)} task results: {e}")
+        finally:
+            for _ in batch:
+                self._result_updates.task_done()
+
+    async def _run_result_flusher(self):
+        """Submit queued task results in batches until cancelled.
+
+        A batch is submitted once it holds `result_batch_size` results or
+        `result_flush_interval` seconds after its first result was queued,
+        whichever comes first.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._result_updates.get()]
+            deadline = loop.time() + self._config.result_flush_interval
+
+            while len(batch) < self._config.result_batch_size:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        batch.append(await self._result_updates.get())
+                except TimeoutError:
+                    break
+
+            await self._submit_results(batch)
+
+    async def _flush_result_updates(self):
+        """Submit all pending task results and stop the background flusher."""
+        if self._result_flusher is not None:
+            await self._result_updates.join()
+            self._result_flusher.cancel()
+            self._result_flusher = None
+
+        batch = []
+        while not self._result_updates.empty():
+            batch.append(self._result_updates.get_nowait())
+        await self._submit_results(batch)
 
     async def _listen(self):
         """Listen for tasks of a specific kind from the broker.
 
+        Tasks are executed concurrently, with at most
+        `max_concurrency` of them in flight at any given time.
+
         ### Raises
         - `RuntimeError`: If broker client is not initialized
         """
         if not self._broker_client:
             raise RuntimeError("Broker client is not initialized.")
 
+        semaphore = asyncio.Semaphore(self._config.max_concurrency)
+        await self._broker_client.subscribe(partial(self._dispatch, semaphore))
+
+    async def _dispatch(
+        self,
+        semaphore: asyncio.Semaphore,
+        payload: memoryview,
+        task_id: str,
+        task_kind: str,
+    ):
+        """Execute a task delivered by the broker. Runs inline in the broker
+        callback, so the message is only acknowledged once the task has
+        finished and the broker's prefetch window bounds the work in flight.
+
+        ### Parameters
+        - `semaphore`: Limits the number of tasks in flight
+        - `payload`: Undecoded input data for the task
+        - `task_id`: Unique identifier for the task
+        - `task_kind`: Kind of the task, used to find its handler
+        """
+        task_func = self._registered_tasks.get(task_kind)
+        if task_func is None:
+            error = f"Task {task_kind} not registered."
+            self._result_updates.put_nowait((task_id, error, True))
+            return
+
+        # The broker already runs each callback in its own Task, which is
+        # tracked so shutdown also waits for deliveries queued on the semaphore
+        task = asyncio.current_task()
+        self._running_tasks.add(task)
         try:
-            async for input_data, task_id, task_kind in self._broker_client.listen():
-                await self._execute_task(task_kind, input_data, task_id)
+            async with semaphore:
+                await self._execute_task(task_func, payload, task_id)
         except asyncio.CancelledError:
-            await self._broker_client.disconnect()
+            # The broker drops cancelled messages instead of requeueing them,
+            # so report the task as failed for the manager not to wait on it
+            logger.warning(f"Task {task_id} cancelled")
+            self._result_updates.put_nowait((task_id, "Task was cancelled.", True))
+            raise
+        finally:
+            self._running_tasks.discard(task)
+
+    async def _wait_for_running_tasks(self):
+        """Wait for all in-flight tasks to finish. Exceptions raised by the
+        tasks are not propagated."""
+        if self._running_tasks:
+            await asyncio.gather(*self._running_tasks, return_exceptions=True)
 
     async def entrypoint(self):
         """Start the worker application.
@@ -159,13 +294,19 @@ class WorkerApplication:
         and handles graceful shutdown.
         """
         await self._register_worker()
+        self._result_flusher = asyncio.create_task(self._run_result_flusher())
 
         try:
             await self._listen()
         except asyncio.CancelledError:
             pass
         finally:
-            await self._unregister_worker()
+            try:
+                await self._wait_for_running_tasks()
+            finally:
+                # Runs even if the shutdown deadline interrupts the wait, so
+                # the results of cancelled tasks still reach the manager
+                await self._unregister_worker()
 
     def cleanup(self):
         """Cleanup the worker application.
@@ -175,5 +316,9 @@ class WorkerApplication:
         self._broker_client = None
         self._manager_client = None
         self._registered_tasks = {}
+        self._task_kinds = ()
+        self._running_tasks = set()
+        self._result_updates = asyncio.Queue()
+        self._result_flusher = None
         self._id = None
         self._config = None
@@ -4,7 +4,7 @@ from broker.config import BrokerConfig
 from manager.config import ManagerConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkerApplicationConfig:
     """Configuration for a worker application. This is passed in on
     initialization of the `WorkerApplication` class, and can come from a config
@@ -14,8 +14,21 @@ class WorkerApplicationConfig:
     - `name`: The name of the worker.
     - `broker_config`: Configuration for the broker.
     - `manager_config`: Configuration for the manager.
+    - `max_concurrency`: Maximum number of tasks executed concurrently.
+      Must be at least 1.
+    - `result_batch_size`: Maximum number of task results submitted to the
+      manager in a single batch.
+    - `result_flush_interval`: Maximum time, in seconds, a task result waits
+      for a batch to fill up before being submitted.
     """
 
     name: str
     broker_config: BrokerConfig
     manager_config: ManagerConfig
+    max_concurrency: int = 64
+    result_batch_size: int = 100
+    result_flush_interval: float = 0.05
+
+    def __post_init__(self):
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
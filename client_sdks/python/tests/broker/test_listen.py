@@ -0,0 +1,59 @@
+import asyncio
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_listen_acknowledges_after_the_caller_moves_on(fake_broker_client):
+    """Tests that a message is only acknowledged once the next one is requested,
+    and that unconsumed messages are requeued when the generator is closed."""
+    fake_broker_client.messages = [(b"{}", str(i), "kind") for i in range(50)]
+
+    with pytest.deprecated_call():
+        messages = fake_broker_client.listen()
+        _, first_id, task_kind = await anext(messages)
+
+    assert first_id == "0"
+    assert task_kind == "kind"
+    await asyncio.sleep(0)
+    assert fake_broker_client.acknowledged == []
+
+    _, second_id, _ = await anext(messages)
+    assert second_id == "1"
+    await asyncio.sleep(0)
+    assert fake_broker_client.acknowledged == ["0"]
+
+    await messages.aclose()
+    assert fake_broker_client.acknowledged == ["0", "1"]
+    assert len(fake_broker_client.requeued) == 48
+    assert fake_broker_client.dropped == []
+
+
+@pytest.mark.asyncio
+async def test_listen_raises_subscribe_errors(fake_broker_client):
+    """Tests that an error raised by subscribe reaches the caller instead of
+    leaving it waiting for messages forever."""
+    fake_broker_client.messages = [(b"{}", "0", "kind")]
+    fake_broker_client.error = ConnectionError("Connection lost")
+
+    with pytest.deprecated_call():
+        messages = fake_broker_client.listen()
+        await anext(messages)
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(anext(messages), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_listen_cleans_up_when_cancelled(fake_broker_client):
+    """Tests that cancelling a caller waiting for a message leaves no pending
+    tasks behind."""
+    with pytest.deprecated_call():
+        messages = fake_broker_client.listen()
+        waiter = asyncio.create_task(anext(messages))
+        await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,30 @@
+"""Worker application run by the supervisor tests in separate processes."""
+
+from broker import BrokerConfig
+from manager import ManagerConfig
+from worker import WorkerApplication, WorkerApplicationConfig
+import asyncio
+import os
+
+READY_DIR_ENV = "TACOQ_TEST_READY_DIR"
+""" Directory in which every started worker process leaves a file."""
+
+
+class SupervisedApplication(WorkerApplication):
+    """Runs until cancelled without connecting to any services."""
+
+    __slots__ = ()
+
+    async def entrypoint(self):
+        ready_file = os.path.join(os.environ[READY_DIR_ENV], str(os.getpid()))
+        open(ready_file, "w").close()
+        await asyncio.Future()
+
+
+app = SupervisedApplication(
+    WorkerApplicationConfig(
+        name="supervised_worker",
+        broker_config=BrokerConfig(url="amqp://localhost"),
+        manager_config=ManagerConfig(url="http://localhost"),
+    )
+)
@@ -0,0 +1,20 @@
+from cli.cli import cli
+from click.testing import CliRunner
+
+
+def test_run_rejects_reload_with_multiple_workers():
+    """Tests that live reload cannot be combined with several worker processes."""
+    result = CliRunner().invoke(
+        cli, ["run", "app:worker", "--reload", "--workers", "2"]
+    )
+
+    assert result.exit_code == 2
+    assert "--reload cannot be used with multiple --workers." in result.output
+
+
+def test_run_rejects_zero_workers():
+    """Tests that at least one worker process is required."""
+    result = CliRunner().invoke(cli, ["run", "app:worker", "--workers", "0"])
+
+    assert result.exit_code == 2
+    assert "--workers" in result.output
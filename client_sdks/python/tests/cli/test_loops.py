@@ -0,0 +1,63 @@
+from cli.loops import LOOP_CHOICES, get_loop_factory
+import sys
+import pytest
+from types import SimpleNamespace
+
+
+@pytest.fixture
+def uvloop_available(monkeypatch: pytest.MonkeyPatch):
+    """Fixture that makes a stand-in uvloop importable on a supported platform."""
+    uvloop = SimpleNamespace(new_event_loop=lambda: None)
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+    return uvloop
+
+
+@pytest.fixture
+def uvloop_missing(monkeypatch: pytest.MonkeyPatch):
+    """Fixture that makes importing uvloop fail."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+
+def test_loop_choices(uvloop_available):
+    """Tests that every loop choice offered by the CLI can be resolved."""
+    for loop in LOOP_CHOICES:
+        get_loop_factory(loop)
+
+
+def test_asyncio_loop_uses_default_factory(uvloop_available):
+    """Tests that `asyncio` always selects the default loop."""
+    assert get_loop_factory("asyncio") is None
+
+
+def test_auto_loop_prefers_uvloop(uvloop_available):
+    """Tests that `auto` selects uvloop when it is installed."""
+    assert get_loop_factory("auto") is uvloop_available.new_event_loop
+
+
+def test_auto_loop_falls_back_to_asyncio(uvloop_missing):
+    """Tests that `auto` selects the default loop when uvloop is missing."""
+    assert get_loop_factory("auto") is None
+
+
+def test_auto_loop_skips_uvloop_on_windows(uvloop_available, monkeypatch):
+    """Tests that `auto` never selects uvloop on Windows."""
+    monkeypatch.setattr(sys, "platform", "win32")
+    assert get_loop_factory("auto") is None
+
+
+def test_uvloop_loop(uvloop_available):
+    """Tests that `uvloop` selects uvloop when it is installed."""
+    assert get_loop_factory("uvloop") is uvloop_available.new_event_loop
+
+
+def test_uvloop_loop_missing(uvloop_missing):
+    """Tests that requesting uvloop without it installed raises a RuntimeError."""
+    with pytest.raises(RuntimeError, match="uvloop` extra"):
+        get_loop_factory("uvloop")
+
+
+def test_unknown_loop():
+    """Tests that an unknown loop choice raises a ValueError."""
+    with pytest.raises(ValueError, match="Unknown event loop"):
+        get_loop_factory("trio")
@@ -0,0 +1,71 @@
+from cli import runner
+from cli.runner import ApplicationRunner
+import asyncio
+import pytest
+
+SHUTDOWN_TIMEOUT = 0.05
+
+
+class FakeApplication:
+    """Stands in for a WorkerApplication whose cleanup after cancellation
+    takes `cleanup_time` seconds."""
+
+    def __init__(self, cleanup_time: float):
+        self.cleanup_time = cleanup_time
+        self.cleaned_up = False
+        self.cleanup_interrupted = False
+
+    async def entrypoint(self):
+        try:
+            await asyncio.Future()
+        finally:
+            try:
+                await asyncio.sleep(self.cleanup_time)
+                self.cleaned_up = True
+            except asyncio.CancelledError:
+                self.cleanup_interrupted = True
+                raise
+
+
+@pytest.fixture(autouse=True)
+def short_shutdown_timeout(monkeypatch: pytest.MonkeyPatch):
+    """Fixture that shortens the shutdown deadline for the tests."""
+    monkeypatch.setattr(runner, "SHUTDOWN_TIMEOUT", SHUTDOWN_TIMEOUT)
+
+
+async def cancel_app(app: FakeApplication) -> asyncio.Task:
+    """Starts the application, cancels it with a deadline and waits for it."""
+    app_runner = ApplicationRunner(app, "fake:app")
+    app_runner._loop = asyncio.get_running_loop()
+    task = asyncio.create_task(app.entrypoint())
+    await asyncio.sleep(0)
+
+    app_runner._cancel_with_deadline(task)
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    return task
+
+
+@pytest.mark.asyncio
+async def test_cancel_with_deadline_interrupts_slow_cleanup(caplog):
+    """Tests that cleanup running past the deadline is cancelled again."""
+    app = FakeApplication(cleanup_time=60)
+
+    await asyncio.wait_for(cancel_app(app), timeout=SHUTDOWN_TIMEOUT * 10)
+
+    assert app.cleanup_interrupted
+    assert not app.cleaned_up
+    assert "Application shutdown timed out" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_cancel_with_deadline_disarms_after_fast_cleanup(caplog):
+    """Tests that the deadline is disarmed once the cleanup finishes in time."""
+    app = FakeApplication(cleanup_time=0)
+
+    await cancel_app(app)
+    await asyncio.sleep(SHUTDOWN_TIMEOUT * 2)
+
+    assert app.cleaned_up
+    assert not app.cleanup_interrupted
+    assert "Application shutdown timed out" not in caplog.text
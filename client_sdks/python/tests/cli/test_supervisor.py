@@ -0,0 +1,80 @@
+from cli import supervisor
+from supervised_app import READY_DIR_ENV
+import multiprocessing
+from multiprocessing.context import SpawnProcess
+import os
+import signal
+import threading
+import time
+import pytest
+
+APP_IMPORT_STRING = "supervised_app:app"
+WORKERS = 3
+
+
+def wait_for_ready_workers(ready_dir: str, count: int, timeout: float = 30.0):
+    """Waits until `count` worker processes have started their application."""
+    deadline = time.monotonic() + timeout
+    while len(os.listdir(ready_dir)) < count:
+        assert time.monotonic() < deadline, "Worker processes did not start"
+        time.sleep(0.05)
+
+
+@pytest.fixture(autouse=True)
+def kill_stuck_workers():
+    """Fixture that kills worker processes still running after a minute, so a
+    shutdown that never completes fails the test instead of hanging it."""
+
+    def kill_workers():
+        for process in multiprocessing.active_children():
+            process.kill()
+
+    watchdog = threading.Timer(60.0, kill_workers)
+    watchdog.start()
+    yield
+    watchdog.cancel()
+
+
+@pytest.fixture
+def ready_dir(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Fixture that provides the directory worker processes report to."""
+    monkeypatch.setenv(READY_DIR_ENV, str(tmp_path))
+    return str(tmp_path)
+
+
+def signal_after_start(monkeypatch: pytest.MonkeyPatch, index: int, before=None):
+    """Makes the supervisor send itself SIGTERM once it has started the worker
+    process at `index`, after calling `before` if given."""
+    start = SpawnProcess.start
+    started = []
+
+    def start_and_signal(process):
+        start(process)
+        started.append(process)
+        if len(started) == index + 1:
+            if before:
+                before()
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    monkeypatch.setattr(SpawnProcess, "start", start_and_signal)
+
+
+def test_supervisor_shuts_down_running_workers(ready_dir, monkeypatch):
+    """Tests that a shutdown signal stops every running worker process cleanly."""
+    signal_after_start(
+        monkeypatch,
+        WORKERS - 1,
+        before=lambda: wait_for_ready_workers(ready_dir, WORKERS),
+    )
+
+    assert supervisor.run_multiprocess(APP_IMPORT_STRING, WORKERS, "asyncio")
+
+
+def test_supervisor_shuts_down_workers_still_starting(ready_dir, monkeypatch):
+    """Tests that worker processes started after a shutdown signal, or still
+    starting up when it arrived, are shut down cleanly instead of crashing or
+    running forever."""
+    signal_after_start(monkeypatch, 0)
+
+    assert supervisor.run_multiprocess(APP_IMPORT_STRING, WORKERS, "asyncio")
+    assert not multiprocessing.active_children()
@@ -1,6 +1,9 @@
 from manager import ManagerClient, ManagerConfig, ManagerStates
 from worker import WorkerApplication, WorkerApplicationConfig
-from broker import BrokerConfig
+from broker import BrokerClient, BrokerConfig, RequeueMessage
+from contextlib import asynccontextmanager
+from typing import Optional
+import asyncio
 import pytest
 
 MANAGER_TEST_URL = "http://localhost:3000"
@@ -55,3 +58,58 @@ async def worker_application(
 ) -> WorkerApplication:
     """Fixture that provides a configured WorkerClient instance."""
     return WorkerApplication(config=worker_config)
+
+
+class FakeBrokerClient(BrokerClient):
+    """Stands in for the broker. `subscribe` delivers `messages` to the
+    callback, each from its own task like the RabbitMQ client does, and
+    records which task IDs were acknowledged, requeued or dropped. If `error` is set,
+    `subscribe` raises it once the messages have been delivered."""
+
+    def __init__(self):
+        self.messages: list[tuple[bytes, str, str]] = []
+        self.error: Optional[Exception] = None
+        self.deliveries: list[asyncio.Task] = []
+        self.acknowledged: list[str] = []
+        self.requeued: list[str] = []
+        self.dropped: list[str] = []
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    @asynccontextmanager
+    async def acquire_channel(self):
+        yield None
+
+    async def _deliver(self, callback, body: bytes, task_id: str, task_kind: str):
+        try:
+            await callback(memoryview(body), task_id, task_kind)
+        except RequeueMessage:
+            self.requeued.append(task_id)
+        except BaseException:
+            self.dropped.append(task_id)
+        else:
+            self.acknowledged.append(task_id)
+
+    async def subscribe(self, callback):
+        self.deliveries = [
+            asyncio.create_task(self._deliver(callback, *message))
+            for message in self.messages
+        ]
+        try:
+            if self.error:
+                await asyncio.sleep(0)
+                raise self.error
+            await asyncio.Future()
+        finally:
+            if self.deliveries:
+                await asyncio.wait(self.deliveries)
+
+
+@pytest.fixture
+def fake_broker_client() -> FakeBrokerClient:
+    """Fixture that provides a FakeBrokerClient instance with no messages."""
+    return FakeBrokerClient()
@@ -0,0 +1,31 @@
+from manager.client import _dumps_json
+import json
+import pytest
+from uuid import uuid4
+
+
+def test_dumps_json_non_str_keys():
+    """Tests that non-string keys are serialized like the standard library does."""
+
+    assert json.loads(_dumps_json({1: "a", None: "b"})) == {"1": "a", "null": "b"}
+
+
+def test_dumps_json_big_int():
+    """Tests that integers outside the 64-bit range survive serialization."""
+
+    big_int = 2**70
+    assert json.loads(_dumps_json({"data": big_int})) == {"data": big_int}
+
+
+def test_dumps_json_uuid():
+    """Tests that UUIDs are serialized as strings."""
+
+    task_id = uuid4()
+    assert json.loads(_dumps_json({"id": task_id})) == {"id": str(task_id)}
+
+
+def test_dumps_json_unserializable():
+    """Tests that unserializable data still raises a TypeError."""
+
+    with pytest.raises(TypeError):
+        _dumps_json({"data": {1, 2, 3}})
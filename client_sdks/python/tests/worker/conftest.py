@@ -0,0 +1,23 @@
+from uuid import UUID
+import pytest
+
+from models.task import TaskOutput
+
+
+class FakeManagerClient:
+    """Stands in for the manager, recording every batch of task results it
+    receives instead of sending them."""
+
+    def __init__(self):
+        self.result_batches: list[list[tuple[UUID, TaskOutput, bool]]] = []
+
+    async def update_task_result_batch(
+        self, results: list[tuple[UUID, TaskOutput, bool]]
+    ) -> None:
+        self.result_batches.append(list(results))
+
+
+@pytest.fixture
+def fake_manager_client() -> FakeManagerClient:
+    """Fixture that provides a FakeManagerClient instance."""
+    return FakeManagerClient()
@@ -0,0 +1,102 @@
+from dataclasses import replace
+from worker import WorkerApplication, WorkerApplicationConfig
+import asyncio
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_dispatch_bounds_concurrency(
+    worker_config: WorkerApplicationConfig, fake_broker_client
+):
+    """Tests that no more than `max_concurrency` tasks run at the same time."""
+    worker_application = WorkerApplication(
+        config=replace(worker_config, max_concurrency=3)
+    )
+    running, peak = 0, 0
+
+    @worker_application.task("slow")
+    async def slow_task(input_data):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return input_data
+
+    fake_broker_client.messages = [(b"{}", str(i), "slow") for i in range(10)]
+    worker_application._broker_client = fake_broker_client
+    listener = asyncio.create_task(worker_application._listen())
+
+    try:
+        await asyncio.sleep(0)
+        await asyncio.wait(fake_broker_client.deliveries)
+    finally:
+        listener.cancel()
+
+    assert peak == 3
+    assert worker_application._running_tasks == set()
+    assert worker_application._result_updates.qsize() == 10
+    assert len(fake_broker_client.acknowledged) == 10
+
+
+def test_max_concurrency_must_be_positive(worker_config: WorkerApplicationConfig):
+    """Tests that a worker cannot be configured to run no tasks at all."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        replace(worker_config, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_reports_unknown_task_kinds(
+    worker_config: WorkerApplicationConfig,
+):
+    """Tests that a task of an unregistered kind is reported as failed."""
+    worker_application = WorkerApplication(config=worker_config)
+    semaphore = asyncio.Semaphore(1)
+
+    await worker_application._dispatch(semaphore, memoryview(b"{}"), "0", "unknown")
+
+    assert worker_application._result_updates.get_nowait() == (
+        "0",
+        "Task unknown not registered.",
+        True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatch_reports_cancelled_tasks(
+    worker_config: WorkerApplicationConfig, fake_broker_client
+):
+    """Tests that tasks cancelled by the shutdown deadline, running or still
+    waiting for a slot, are reported as failed and their messages dropped
+    rather than requeued."""
+    worker_application = WorkerApplication(
+        config=replace(worker_config, max_concurrency=2)
+    )
+
+    @worker_application.task("slow")
+    async def slow_task(input_data):
+        await asyncio.sleep(60)
+
+    fake_broker_client.messages = [(b"{}", str(i), "slow") for i in range(3)]
+    worker_application._broker_client = fake_broker_client
+    listener = asyncio.create_task(worker_application._listen())
+
+    try:
+        await asyncio.sleep(0.01)
+        assert len(worker_application._running_tasks) == 3
+
+        # What the runner's shutdown deadline does to the broker's callbacks
+        for delivery in fake_broker_client.deliveries:
+            delivery.cancel()
+        await asyncio.wait(fake_broker_client.deliveries)
+    finally:
+        listener.cancel()
+
+    results = []
+    while not worker_application._result_updates.empty():
+        results.append(worker_application._result_updates.get_nowait())
+
+    assert sorted(results) == [(str(i), "Task was cancelled.", True) for i in range(3)]
+    assert sorted(fake_broker_client.dropped) == ["0", "1", "2"]
+    assert fake_broker_client.requeued == []
+    assert worker_application._running_tasks == set()
@@ -0,0 +1,95 @@
+from dataclasses import replace
+from worker import WorkerApplication, WorkerApplicationConfig
+import asyncio
+import pytest
+
+
+def start_flusher(
+    worker_config: WorkerApplicationConfig, fake_manager_client, **overrides
+) -> WorkerApplication:
+    """Creates a worker reporting to the fake manager and starts its flusher."""
+    worker_application = WorkerApplication(config=replace(worker_config, **overrides))
+    worker_application._manager_client = fake_manager_client
+    worker_application._result_flusher = asyncio.create_task(
+        worker_application._run_result_flusher()
+    )
+    return worker_application
+
+
+@pytest.mark.asyncio
+async def test_result_flusher_cuts_batches_at_batch_size(
+    worker_config: WorkerApplicationConfig, fake_manager_client
+):
+    """Tests that a full batch is submitted without waiting for the flush interval."""
+    worker_application = start_flusher(
+        worker_config,
+        fake_manager_client,
+        result_batch_size=3,
+        result_flush_interval=60.0,
+    )
+
+    try:
+        for i in range(7):
+            worker_application._result_updates.put_nowait((str(i), {}, False))
+        await asyncio.sleep(0.01)
+
+        batch_ids = [
+            [task_id for task_id, _, _ in batch]
+            for batch in fake_manager_client.result_batches
+        ]
+        assert batch_ids == [["0", "1", "2"], ["3", "4", "5"]]
+    finally:
+        worker_application._result_flusher.cancel()
+
+
+@pytest.mark.asyncio
+async def test_result_flusher_cuts_batches_at_flush_interval(
+    worker_config: WorkerApplicationConfig, fake_manager_client
+):
+    """Tests that a partial batch is submitted once the flush interval expires."""
+    worker_application = start_flusher(
+        worker_config,
+        fake_manager_client,
+        result_batch_size=100,
+        result_flush_interval=0.05,
+    )
+
+    try:
+        worker_application._result_updates.put_nowait(("0", {}, False))
+        worker_application._result_updates.put_nowait(("1", {}, True))
+        await asyncio.sleep(0.01)
+        assert fake_manager_client.result_batches == []
+
+        await asyncio.sleep(0.1)
+        assert fake_manager_client.result_batches == [
+            [("0", {}, False), ("1", {}, True)]
+        ]
+    finally:
+        worker_application._result_flusher.cancel()
+
+
+@pytest.mark.asyncio
+async def test_flush_result_updates_submits_pending_results(
+    worker_config: WorkerApplicationConfig, fake_manager_client
+):
+    """Tests that flushing on shutdown submits every queued result and stops the
+    flusher."""
+    worker_application = start_flusher(
+        worker_config,
+        fake_manager_client,
+        result_batch_size=2,
+        result_flush_interval=0.05,
+    )
+    flusher = worker_application._result_flusher
+
+    for i in range(3):
+        worker_application._result_updates.put_nowait((str(i), {}, False))
+    await worker_application._flush_result_updates()
+
+    submitted = [
+        result for batch in fake_manager_client.result_batches for result in batch
+    ]
+    assert [task_id for task_id, _, _ in submitted] == ["0", "1", "2"]
+    assert worker_application._result_flusher is None
+    await asyncio.sleep(0)
+    assert flusher.cancelled()
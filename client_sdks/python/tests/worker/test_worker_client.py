@@ -1,8 +1,10 @@
 from worker import WorkerApplication
 from manager import ManagerClient
+from models.task import task_input_from_buffer
+import asyncio
 import pytest
+from typing import Tuple
 from uuid import uuid4
-from builtins import anext
 
 
 # Test Task Definitions. One will fail and one will complete successfully.
@@ -14,6 +16,30 @@ async def successful_task(input_data):
     return input_data
 
 
+async def execute_next_task(
+    worker_application: WorkerApplication,
+) -> Tuple[memoryview, str, str]:
+    """Subscribes to the worker queue until one task has been executed, and
+    returns the message it was delivered in."""
+    delivered = asyncio.get_running_loop().create_future()
+
+    async def on_message(data: memoryview, task_id: str, task_kind: str):
+        await worker_application._execute_task(
+            worker_application._registered_tasks[task_kind], data, task_id
+        )
+        if not delivered.done():
+            delivered.set_result((data, task_id, task_kind))
+
+    consumer = asyncio.create_task(
+        worker_application._broker_client.subscribe(on_message)
+    )
+    try:
+        return await delivered
+    finally:
+        consumer.cancel()
+        await asyncio.wait((consumer,))
+
+
 @pytest.mark.asyncio
 async def test_worker_startup_and_task_success(
     worker_application: WorkerApplication, manager_client: ManagerClient
@@ -30,13 +56,11 @@ async def test_worker_startup_and_task_success(
         input_data = {"test": "data"}
         await manager_client.publish_task(TEST_TASK_KIND, input_data)
 
-        data, task_id, task_kind = await anext(
-            worker_application._broker_client.listen()
-        )
-        assert input_data == data
-
         # This should execute the task with the given function
-        await worker_application._execute_task(task_kind, data, task_id)
+        data, task_id, task_kind = await execute_next_task(worker_application)
+        assert input_data == task_input_from_buffer(data)
+        assert task_kind == TEST_TASK_KIND
+        await worker_application._flush_result_updates()
 
         # # Process task successfully
         task = await manager_client.get_task(task_id)
@@ -63,13 +87,11 @@ async def test_worker_task_failure_handling(
         input_data = {"test": "data"}
         await manager_client.publish_task(TEST_TASK_KIND, input_data)
 
-        data, task_id, task_kind = await anext(
-            worker_application._broker_client.listen()
-        )
-        assert input_data == data
-
         # This should execute the task with the given function
-        await worker_application._execute_task(task_kind, data, task_id)
+        data, task_id, task_kind = await execute_next_task(worker_application)
+        assert input_data == task_input_from_buffer(data)
+        assert task_kind == TEST_TASK_KIND
+        await worker_application._flush_result_updates()
 
         # Check that the task failed
         task = await manager_client.get_task(task_id)